@@ -1,39 +1,95 @@
 #!/usr/bin/env python3
 import os
 import sys
+import asyncio
+import atexit
+import functools
 import subprocess
 import shutil
 import logging
 import platform
 import time
 import re
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import traceback
+import types
+import certifi
+import urllib3
 from minio import Minio
-from minio.error import S3Error
+from minio.error import S3Error, ServerError
 from dotenv import load_dotenv
 from pymongo import MongoClient
 
 # Load environment variables for MinIO
 load_dotenv()
 
+# Configuration is read once at import; the environment doesn't change during a run
+_TRUE_SET = frozenset({"true", "1", "t"})
+_IS_WINDOWS = platform.system() == "Windows"
+_MINIO_CFG = types.SimpleNamespace(
+    endpoint=os.getenv("MINIO_ENDPOINT"),
+    access_key=os.getenv("MINIO_ACCESS_KEY"),
+    secret_key=os.getenv("MINIO_SECRET_KEY"),
+    secure=os.getenv("MINIO_SECURE", "True").lower() in _TRUE_SET,
+    ca_certs=os.getenv("SSL_CERT_FILE") or certifi.where(),
+)
+_MONGO_CFG = types.SimpleNamespace(
+    host=os.getenv("MONGO_HOST"),
+    port=os.getenv("MONGO_PORT"),
+    user=os.getenv("MONGO_USER"),
+    password=os.getenv("MONGO_PASS"),
+    db=os.getenv("MONGO_DB"),
+)
+
 # Define a fixed bucket name for all machines
 MINIO_BUCKET_NAME = "hpe-log-analysis"
 
-# Import shared tasks and success-failure check
+# Number of files uploaded to MinIO concurrently for each machine
+MINIO_UPLOAD_CONCURRENCY = max(1, int(os.getenv("MINIO_UPLOAD_CONCURRENCY", "10")))
+
+# Files larger than this are uploaded as multipart with parts sent in parallel
+MINIO_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+MINIO_PART_SIZE = int(os.getenv("MINIO_PART_SIZE", str(10 * 1024 * 1024)))
+MINIO_PART_CONCURRENCY = int(os.getenv("MINIO_PART_CONCURRENCY", "8"))
+
+# Read buffer for files streamed to MinIO
+UPLOAD_READ_BUFFER = 1 << 20
+
+# Backoff settings for MinIO throttling/unavailable (429/503) responses (seconds)
+MINIO_RETRY_STATUSES = (429, 503)
+MINIO_SLOWDOWN_RETRIES = 5
+MINIO_BACKOFF_BASE = 0.5
+MINIO_BACKOFF_CAP = 20
+MINIO_BACKOFF_JITTER = 0.5
+
+# Number of machines processed concurrently by the asyncio pipeline
+MACHINE_CONCURRENCY = max(1, int(os.getenv("MACHINE_CONCURRENCY", str(os.cpu_count() or 1))))
+
+# Keep-alive connections kept for MinIO; defaults to the most requests that can be
+# in flight at once (machines x files per machine x parts per file)
+MINIO_POOL_SIZE = int(os.getenv(
+    "MINIO_POOL_SIZE",
+    str(MACHINE_CONCURRENCY * MINIO_UPLOAD_CONCURRENCY * MINIO_PART_CONCURRENCY)
+))
+
+# Client-side limit on MinIO requests started per second, shared by all uploads
+MINIO_MAX_RPS = float(os.getenv("MINIO_MAX_RPS", "100"))
+MINIO_BURST = int(os.getenv("MINIO_BURST", "20"))
+
+# Minimum time between upload progress reports (seconds)
+PROGRESS_INTERVAL = 0.25
+
+# Import shared tasks and success/failure check
 try:
     from shared_tasks import prepare_machine as shared_prepare_machine
     from shared_tasks import run_log_extraction as shared_run_log_extraction
-    # Import determine_update_type_and_check from success-failure.py
-    # Using importlib to handle hyphenated filename
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("success_failure", "success-failure.py")
-    success_failure = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(success_failure)
-    determine_update_type_and_check = success_failure.determine_update_type_and_check
+    from success_failure import UpdateStatus, determine_update_type_and_check_bytes
 except ImportError as e:
-    logging.error(f"Failed to import modules: {str(e)}. Make sure shared_tasks.py and success-failure.py are in the same directory.")
+    logging.error(f"Failed to import modules: {str(e)}. Make sure shared_tasks.py and success_failure.py are in the same directory.")
     sys.exit(1)
 
 # Configure logging
@@ -58,11 +114,14 @@ class Colors:
     BOLD =  '\033[1m'
     UNDERLINE =     '\033[4m'
 
+# Section banner built once; print_section fills in the title and writes it in one call
+_SECTION_RULE = f"{Colors.HEADER}{Colors.BOLD}{'=  '*80}{Colors.ENDC}"
+_SECTION_FMT = f"\n{_SECTION_RULE}\n{Colors.HEADER}{Colors.BOLD}=== {{title}} {Colors.ENDC}\n{_SECTION_RULE}\n\n"
+
 def print_section(title):
     """Print a formatted section title"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{ '=  '*80}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}=== {title} {Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{   '=  '*80}{Colors.ENDC}\n")
+    sys.stdout.write(_SECTION_FMT.format(title=title))
+    sys.stdout.flush()
 
 def print_step(step):
     """Print a formatted step description"""
@@ -80,6 +139,9 @@ def print_error(message):
     """Print an error message"""
     print(f"{Colors.RED}{Colors.BOLD}✗ {message}{Colors.ENDC}")
 
+# Larger kernel pipe buffers (Python 3.10+) cut syscalls for chatty commands
+PIPE_KWARGS = {"pipesize": 1024 * 1024} if sys.version_info >= (3, 10) else {}
+
 def run_command(command, shell=False, check=True, cwd=None, capture_output=True):
     """Run a shell command and return the result, logging output."""
     try:
@@ -94,7 +156,9 @@ def run_command(command, shell=False, check=True, cwd=None, capture_output=True)
             stdout=subprocess.PIPE if capture_output else None,
             stderr=subprocess.PIPE if capture_output else None,
             text=True,
-            cwd=cwd
+            bufsize=-1,
+            cwd=cwd,
+            **(PIPE_KWARGS if capture_output else {})
         )
         
         if capture_output:
@@ -151,14 +215,14 @@ def setup_virtual_environment():
             run_command([sys.executable, "-m", "venv", ".venv"], check=True)
         
         # Determine the correct pip path based on OS
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             pip_path = str(venv_dir / "Scripts" / "pip.exe")
             # On Windows, running pip directly often works better than activate+pip
-            run_command([pip_path, "install", "-r", str(requirements_file)], check=True)
+            run_command([pip_path, "install", "-r", str(requirements_file)], check=True, capture_output=False)
         else:
             pip_path = str(venv_dir / "bin" / "pip")
-            # Use the pip from the venv directly
-            run_command([pip_path, "install", "-r", str(requirements_file)], check=True)
+            # Use the pip from the venv directly; pip's output goes straight to the console
+            run_command([pip_path, "install", "-r", str(requirements_file)], check=True, capture_output=False)
         
         print_success("Virtual environment setup complete")
         return True
@@ -166,49 +230,218 @@ def setup_virtual_environment():
         print_error(f"Failed to set up virtual environment: {str(e)}")
         return False
 
+_MINIO_CLIENT_LOCK = threading.Lock()
+
 def get_minio_client():
-    """Get a MinIO client with proper error handling"""
+    """Get the shared MinIO client (created on first use) with proper error handling"""
+    # Machines upload from several threads; the lock ensures only one builds the client
+    with _MINIO_CLIENT_LOCK:
+        return _create_minio_client()
+
+@functools.lru_cache(maxsize=1)
+def _create_minio_client():
+    """Build the MinIO client; cached so it only happens once per process."""
     try:
+        # Retry transient server errors with exponential backoff. 429/503 responses
+        # are not retried here so they reach the rate-limited loop in upload_file_to_minio
+        http_client = urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=300, read=300),
+            maxsize=MINIO_POOL_SIZE, # Keep-alive connections reused by concurrent uploads
+            block=False,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=_MINIO_CFG.ca_certs,
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 504],
+                respect_retry_after_header=False, # Otherwise 429/503 with Retry-After are still retried
+                raise_on_status=False, # Let MinIO turn the final response into an S3Error
+            ),
+        )
         client = Minio(
-            os.getenv("MINIO_ENDPOINT"),
-            access_key=os.getenv("MINIO_ACCESS_KEY"),
-            secret_key=os.getenv("MINIO_SECRET_KEY"),
-            secure=os.getenv("MINIO_SECURE", "True").lower() in ("true", "1", "t"),
+            _MINIO_CFG.endpoint,
+            access_key=_MINIO_CFG.access_key,
+            secret_key=_MINIO_CFG.secret_key,
+            secure=_MINIO_CFG.secure,
+            http_client=http_client,
         )
-        logging.info(f"Successfully connected to MinIO at {os.getenv('MINIO_ENDPOINT')}")
+        atexit.register(http_client.clear)
+        logging.info(f"Successfully connected to MinIO at {_MINIO_CFG.endpoint}")
         return client
     except Exception as e:
         logging.error(f"Failed to initialize MinIO client: {str(e)}")
         raise
 
+class TokenBucket:
+    """Thread-safe token bucket that caps how many requests start per second."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it. A rate <= 0 disables the cap."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self.rate <= 0:
+                        return
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Hand out no tokens for the given time and restart from an empty bucket afterwards."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = self._paused_until
+
+_UPLOAD_LIMITER = TokenBucket(MINIO_MAX_RPS, MINIO_BURST)
+
+def _is_retryable_upload_error(error):
+    """True for 429/503 responses (SlowDown, ServiceUnavailable, server restarting, ...)."""
+    if isinstance(error, ServerError):
+        return error.status_code in MINIO_RETRY_STATUSES
+    response = getattr(error, "response", None)
+    return response is not None and response.status in MINIO_RETRY_STATUSES
+
+def _retry_after_seconds(error):
+    """Return the Retry-After delay (in seconds) from an S3Error's response, if present."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+# Set once the bucket has been confirmed or created so later machines skip the check
+_BUCKET_READY = False
+_BUCKET_LOCK = threading.Lock()
+
+def ensure_bucket(client):
+    """Make sure MINIO_BUCKET_NAME exists, only contacting MinIO on the first call."""
+    global _BUCKET_READY
+    if _BUCKET_READY:
+        return
+    with _BUCKET_LOCK: # Machines upload from several threads at once
+        if _BUCKET_READY:
+            return
+        if not client.bucket_exists(MINIO_BUCKET_NAME):
+            client.make_bucket(MINIO_BUCKET_NAME)
+            logging.info(f"Created bucket: {MINIO_BUCKET_NAME}")
+        else:
+            logging.info(f"Using existing bucket: {MINIO_BUCKET_NAME}")
+        _BUCKET_READY = True
+
+# Precompiled patterns and translation table for sanitize_name
+_SEPARATORS_TO_HYPHEN = str.maketrans("_ ", "--")
+_INVALID_CHARS = re.compile(r"[^a-z0-9.-]")
+_DASHES = re.compile(r"-+")
+_DOTS = re.compile(r"\.+")
+_LEADING_ALNUM = re.compile(r"^[a-z0-9]")
+_TRAILING_ALNUM = re.compile(r"[a-z0-9]$")
+
 def sanitize_name(name):
     """
     Sanitize a string to be used as a valid S3 object prefix or bucket name.
     """
-    # Convert to lowercase
-    name = name.lower()
-
-    # Replace underscores and spaces with hyphens
-    name = name.replace("_", "-").replace(" ", "-")
+    # Convert to lowercase and replace underscores and spaces with hyphens
+    name = name.lower().translate(_SEPARATORS_TO_HYPHEN)
 
     # Remove any invalid characters (only allow a-z, 0-9, . and -)
-    name = re.sub(r"[^a-z0-9.-]", "", name)
+    name = _INVALID_CHARS.sub("", name)
 
     # Replace consecutive hyphens or dots with a single one
-    name = re.sub(r"[-]+", "-", name)
-    name = re.sub(r"[.]+", ".", name)
+    name = _DASHES.sub("-", name)
+    name = _DOTS.sub(".", name)
 
     # Remove leading and trailing hyphens and dots
     name = name.strip(".-")
 
     # Ensure it starts and ends with a letter or number
-    if len(name) > 0 and not re.match(r"^[a-z0-9]", name):
+    if len(name) > 0 and not _LEADING_ALNUM.match(name):
         name = "a" + name
-    if len(name) > 0 and not re.match(r"[a-z0-9]$", name):
+    if len(name) > 0 and not _TRAILING_ALNUM.match(name):
         name = name + "z"
 
     return name
 
+# Object keys always use "/" regardless of the local path separator
+_SEP_FIX = str.maketrans("\\", "/")
+if os.sep == "/":
+    _to_object_path = lambda rel_path: rel_path
+else:
+    _to_object_path = lambda rel_path: rel_path.translate(_SEP_FIX)
+
+def _walk_files(path, base_len):
+    """
+    Recursively yield (os.DirEntry, relative_path) for every regular file under path.
+    Like os.walk, symlinked directories are not descended into; they, dangling
+    symlinks and unreadable directories are skipped. base_len is len(root) + 1, so the relative path is a
+    plain slice of entry.path.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError as e:
+        # Like os.walk, skip directories that can't be listed instead of failing the walk
+        logging.warning(f"Skipping unreadable directory {path}: {str(e)}")
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, base_len)
+            elif entry.is_file():
+                yield entry, entry.path[base_len:]
+
+def upload_file_to_minio(client, minio_path, file_path):
+    """Upload a single file to MinIO, backing off while the server is throttling or unavailable."""
+    file_size = os.stat(file_path).st_size
+    # Small files keep the single-PUT path (one part covering the whole file);
+    # large logs are split into parts uploaded in parallel
+    if file_size > MINIO_MULTIPART_THRESHOLD:
+        upload_kwargs = {"part_size": MINIO_PART_SIZE, "num_parallel_uploads": MINIO_PART_CONCURRENCY}
+    else:
+        upload_kwargs = {"part_size": MINIO_MULTIPART_THRESHOLD}
+
+    # 500/502/504 are retried by the client's urllib3 pool; 429/503 are retried here
+    # so every attempt goes through the rate limiter
+    for attempt in range(MINIO_SLOWDOWN_RETRIES + 1):
+        # Stream through a large read buffer; reopened each attempt so retries start at offset 0
+        file_data = open(file_path, "rb", buffering=UPLOAD_READ_BUFFER)
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(file_data.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            _UPLOAD_LIMITER.acquire()
+            client.put_object(MINIO_BUCKET_NAME, minio_path, file_data, file_size, **upload_kwargs)
+            return
+        except (S3Error, ServerError) as e:
+            if not _is_retryable_upload_error(e) or attempt == MINIO_SLOWDOWN_RETRIES:
+                raise
+            retry_after = _retry_after_seconds(e)
+            if retry_after is not None:
+                # The server told us how long to back off; hold every upload, not just this one
+                _UPLOAD_LIMITER.pause(retry_after)
+                delay = retry_after + random.uniform(0, MINIO_BACKOFF_JITTER)
+            else:
+                delay = min(MINIO_BACKOFF_CAP, MINIO_BACKOFF_BASE * 2 ** attempt) + random.uniform(0, MINIO_BACKOFF_JITTER)
+            reason = e.code if isinstance(e, S3Error) else f"HTTP {e.status_code}"
+            logging.warning(f"MinIO throttled ({reason}): retry={attempt+1}/{MINIO_SLOWDOWN_RETRIES} delay={delay:.2f}s object={minio_path}")
+            time.sleep(delay)
+        finally:
+            file_data.close()
+
 def upload_to_minio(machine_name, base_output_dir_str="./output"):
     """Upload machine's output (from base_output_dir) to MinIO with error handling."""
     try:
@@ -233,68 +466,59 @@ def upload_to_minio(machine_name, base_output_dir_str="./output"):
 
         # Check if the bucket exists, create if not
         try:
-            if not client.bucket_exists(MINIO_BUCKET_NAME):
-                client.make_bucket(MINIO_BUCKET_NAME)
-                logging.info(f"Created bucket: {MINIO_BUCKET_NAME}")
-            else:
-                logging.info(f"Using existing bucket: {MINIO_BUCKET_NAME}")
+            ensure_bucket(client)
         except Exception as e:
             error_msg = f"Error checking/creating MinIO bucket: {str(e)}"
             logging.error(error_msg)
             print_error(error_msg)
             return False
 
-        # Count files for progress tracking
-        total_files = sum(len(files) for _, _, files in os.walk(output_path))
-        if total_files == 0:
-            warning_msg = f"No files found in {output_path} to upload for {machine_name}."
-            logging.warning(warning_msg)
-            print_warning(warning_msg)
-            return True # Not an error, just nothing to upload
-            
-        logging.info(f"Found {total_files} files to upload for {machine_name}")
-        print_step(f"Found {total_files} files to upload for {machine_name}")
-
         upload_count = 0
         file_count = 0
         error_count = 0
 
-        # Upload files recursively with error handling
-        for root, dirs, files in os.walk(output_path):
-            # Process files first
-            for file in sorted(files):
-                file_count += 1
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, output_path)
+        # Upload files concurrently while the tree is still being walked;
+        # a single MinIO client is shared across threads
+        with ThreadPoolExecutor(max_workers=MINIO_UPLOAD_CONCURRENCY) as executor:
+            futures = {}
+            for entry, rel_path in _walk_files(output_path, len(output_path) + 1):
                 # Create MinIO path with machine prefix
-                minio_path = f"{machine_prefix}/{rel_path.replace('\\', '/')}"
+                minio_path = f"{machine_prefix}/{_to_object_path(rel_path)}"
+                future = executor.submit(upload_file_to_minio, client, minio_path, entry.path)
+                futures[future] = entry.name
+
+            # The walk is finished once every file has been submitted
+            total_files = len(futures)
+            if total_files == 0:
+                warning_msg = f"No files found in {output_path} to upload for {machine_name}."
+                logging.warning(warning_msg)
+                print_warning(warning_msg)
+                return True # Not an error, just nothing to upload
 
+            logging.info(f"Found {total_files} files to upload for {machine_name}")
+            print_step(f"Found {total_files} files to upload for {machine_name}")
+
+            last_progress = time.monotonic()
+            for future in as_completed(futures):
+                file_count += 1
+                file = futures[future]
                 try:
-                    # Show progress periodically
-                    if file_count % 10 == 0 or file_count == 1 or file_count == total_files:
-                        progress_msg = f"Uploading file {file_count}/{total_files} ({file_count/total_files*100:.1f}%): {file}"
-                        logging.info(progress_msg)
-                        if file_count % 50 == 0 or file_count == 1 or file_count == total_files:
-                            print_step(progress_msg)
-
-                    # Upload the file with retry on failure
-                    for attempt in range(3):  # Try up to 3 times
-                        try:
-                            client.fput_object(MINIO_BUCKET_NAME, minio_path, file_path)
-                            upload_count += 1
-                            break
-                        except Exception as e:
-                            if attempt < 2:  # Don't log on the last attempt as we'll log after the loop
-                                logging.warning(f"Retry {attempt+1}/3 for {file}: {str(e)}")
-                                time.sleep(1)  # Small delay before retry
-                            else:
-                                raise
+                    future.result()
+                    upload_count += 1
                 except Exception as e:
                     error_msg = f"Failed to upload {file}: {str(e)}"
                     logging.error(error_msg)
                     error_count += 1
                     # Continue with other files
 
+                # Show progress at most every PROGRESS_INTERVAL seconds
+                now = time.monotonic()
+                if file_count == 1 or file_count == total_files or now - last_progress >= PROGRESS_INTERVAL:
+                    last_progress = now
+                    progress_msg = f"Uploaded file {file_count}/{total_files} ({file_count/total_files*100:.1f}%): {file}"
+                    logging.info(progress_msg)
+                    print_step(progress_msg)
+
         # Final report
         if upload_count > 0:
             success_rate = (upload_count / total_files) * 100 if total_files > 0 else 0
@@ -325,6 +549,25 @@ def upload_to_minio(machine_name, base_output_dir_str="./output"):
         traceback.print_exc()
         return False
 
+def remove_directories(paths):
+    """
+    Remove directory trees concurrently; threads overlap the per-file unlink latency.
+
+    Returns:
+        dict: Maps each path that could not be removed to its exception.
+    """
+    failures = {}
+    if not paths:
+        return failures
+    with ThreadPoolExecutor(max_workers=min(len(paths), (os.cpu_count() or 1) * 4)) as executor:
+        futures = {executor.submit(shutil.rmtree, path): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failures[futures[future]] = e
+    return failures
+
 def cleanup_directories(base_source_dir_str="./machines", base_output_dir_str="./output"):
     """Clean up output directories and previously processed data in source dirs"""
     print_section("Cleaning Up Previous Data")
@@ -333,28 +576,41 @@ def cleanup_directories(base_source_dir_str="./machines", base_output_dir_str=".
     source_dir = Path(base_source_dir_str)
     
     try:
-        # Clean output directory
+        # Collect everything to delete first, then remove it all in one parallel pass
+        targets = []
         if output_dir.exists():
             print_step(f"Removing existing output directory: {output_dir}...")
-            shutil.rmtree(output_dir)
+            targets.append(output_dir)
+
+        required_dirs = []
+        if source_dir.is_dir():
+            print_step(f"Removing existing 'required_files' directories within {source_dir}...")
+            required_dirs = [item for item in source_dir.glob("**/required_files") if item.is_dir()] # Recursive search
+            # Nested matches disappear with their parent
+            required_set = set(required_dirs)
+            required_dirs = [item for item in required_dirs if not required_set.intersection(item.parents)]
+            targets.extend(required_dirs)
+        else:
+            print_warning(f"Source directory {source_dir} not found, skipping required_files cleanup.")
+
+        failures = remove_directories(targets)
+
+        # Clean output directory
+        if output_dir in failures:
+            raise failures[output_dir]
         os.makedirs(output_dir, exist_ok=True)
         print_success(f"Cleaned and recreated output directory: {output_dir}")
         
         # Clean required_files directories in machine folders
         if source_dir.is_dir():
-            print_step(f"Removing existing 'required_files' directories within {source_dir}...")
             count = 0
-            for item in source_dir.glob("**/required_files"): # Recursive search
-                if item.is_dir():
-                    try:
-                        shutil.rmtree(item)
-                        logging.info(f"Removed directory: {item}")
-                        count += 1
-                    except Exception as e:
-                        print_warning(f"Could not remove {item}: {str(e)}")
+            for item in required_dirs:
+                if item in failures:
+                    print_warning(f"Could not remove {item}: {str(failures[item])}")
+                else:
+                    logging.info(f"Removed directory: {item}")
+                    count += 1
             print_success(f"Removed {count} 'required_files' directories.")
-        else:
-            print_warning(f"Source directory {source_dir} not found, skipping required_files cleanup.")
             
         return True
     except Exception as e:
@@ -365,44 +621,43 @@ def cleanup_directories(base_source_dir_str="./machines", base_output_dir_str=".
 # Removed local definitions of extract_sdmp_file, find_sdmp_files, prepare_machine, run_log_extraction
 # These are now imported from shared_tasks.py
 
+@functools.lru_cache(maxsize=1)
+def get_mongo_client():
+    """Get the shared MongoDB client (created on first use, closed at exit)."""
+    # MongoDB connection using credentials from .env
+    client = MongoClient(
+        host=_MONGO_CFG.host,
+        port=int(_MONGO_CFG.port),
+        username=_MONGO_CFG.user,
+        password=_MONGO_CFG.password,
+        maxPoolSize=16,
+        minPoolSize=4
+    )
+    atexit.register(client.close)
+    return client
+
 def update_machine_status_counts(success_count, failure_count):
     """Update machine update status counts in MongoDB."""
     try:
-        # MongoDB connection using credentials from .env
-        client = MongoClient(
-            host=os.getenv("MONGO_HOST"),
-            port=int(os.getenv("MONGO_PORT")),
-            username=os.getenv("MONGO_USER"),
-            password=os.getenv("MONGO_PASS")
-        )
+        client = get_mongo_client()
         
         # Get or create database
-        db = client[os.getenv("MONGO_DB")]
+        db = client[_MONGO_CFG.db]
         
         # Get or create Analytics collection
         analytics_collection = db["Analytics"]
         
-        # Get or create the machine status count document
-        status_doc = analytics_collection.find_one({"_id": "Machine update status count"})
-        
-        if status_doc is None:
-            # Create new document if it doesn't exist
-            analytics_collection.insert_one({
-                "_id": "Machine update status count",
-                "successful_updates": success_count,
-                "failed_updates": failure_count
-            })
-        else:
-            # Update existing document
-            analytics_collection.update_one(
-                {"_id": "Machine update status count"},
-                {
-                    "$inc": {
-                        "successful_updates": success_count,
-                        "failed_updates": failure_count
-                    }
+        # Increment the counters in a single atomic upsert (creates the document if missing)
+        analytics_collection.update_one(
+            {"_id": "Machine update status count"},
+            {
+                "$inc": {
+                    "successful_updates": success_count,
+                    "failed_updates": failure_count
                 }
-            )
+            },
+            upsert=True
+        )
         
         print_success(f"Updated MongoDB analytics: {success_count} successes, {failure_count} failures")
         logging.info(f"Updated MongoDB analytics: {success_count} successes, {failure_count} failures")
@@ -436,12 +691,15 @@ def check_firmware_update_status(machine_name, base_output_dir_str="./output"):
             print_warning(warning_msg)
             return False
         
-        # Call the determine_update_type_and_check function to check status
-        result = determine_update_type_and_check(installsetlog_path, cidebug_path)
+        # Read each log once as raw bytes and scan without decoding
+        status, message = determine_update_type_and_check_bytes(
+            Path(installsetlog_path).read_bytes(),
+            Path(cidebug_path).read_bytes()
+        )
+        result = f"{cidebug_path}: {message}"
         logging.info(f"Firmware update status for {machine_name}: {result}")
         
-        # Check if result indicates success (look for "✅" in the result string)
-        if "✅" in result:
+        if status is UpdateStatus.SUCCESS:
             success_msg = f"Firmware update was SUCCESSFUL for {machine_name}: {result}"
             logging.info(success_msg)
             print_success(success_msg)
@@ -500,6 +758,83 @@ def write_master_signal(should_run_master=False):
 # Removed run_master_process() function as it's no longer called from here.
 # def run_master_process(): ...
 
+def remove_machine_output(machine_name, base_output_dir_str="./output"):
+    """Remove a machine's output directory so master.py does not process it."""
+    try:
+        machine_output_path = os.path.join(base_output_dir_str, machine_name)
+        if os.path.exists(machine_output_path):
+            print_step(f"Removing output directory for {machine_name} to prevent further processing...")
+            shutil.rmtree(machine_output_path)
+            print_success(f"Successfully removed output directory for {machine_name}")
+            logging.info(f"Removed output directory for {machine_name} at {machine_output_path}")
+        else:
+            print_warning(f"Output directory for {machine_name} not found at {machine_output_path}")
+            logging.warning(f"Output directory for {machine_name} not found at {machine_output_path}")
+    except Exception as e:
+        error_msg = f"Failed to remove output directory for {machine_name}: {str(e)}"
+        print_error(error_msg)
+        logging.error(error_msg)
+        traceback.print_exc()
+
+async def process_machine(machine_name, semaphore, base_source_dir_str="./machines", base_output_dir_str="./output"):
+    """
+    Prepare, extract, check and (on update failure) upload a single machine.
+    Blocking steps run in worker threads so other machines progress meanwhile.
+
+    Returns:
+        tuple: (machine_name, ok, is_update_success, is_update_failure)
+    """
+    async with semaphore:
+        machine_path = Path(base_source_dir_str) / machine_name
+        print_section(f"Processing {machine_name} - Prep, Extract & Upload")
+
+        # Prepare the machine using shared function
+        print_step(f"Preparing {machine_name}...")
+        prep_success = await asyncio.to_thread(shared_prepare_machine, str(machine_path))
+
+        if not prep_success:
+            print_warning(f"Preparation failed for {machine_name}. Skipping extraction.")
+            return machine_name, False, False, False
+        print_success(f"Preparation successful for {machine_name}.")
+
+        # Run log extraction using shared function
+        print_step(f"Running log extraction for {machine_name}...")
+        extract_success = await asyncio.to_thread(shared_run_log_extraction, machine_name, base_source_dir_str, base_output_dir_str)
+
+        if not extract_success:
+            print_warning(f"Log extraction failed for {machine_name}.")
+            return machine_name, False, False, False
+        print_success(f"Log extraction successful for {machine_name}.")
+
+        # Check firmware update status
+        print_step(f"Checking firmware update status for {machine_name}...")
+        is_update_success = await asyncio.to_thread(check_firmware_update_status, machine_name, base_output_dir_str)
+
+        # Only proceed with upload if update was a failure
+        if is_update_success:
+            print_step(f"Skipping MinIO upload for {machine_name} as firmware update was successful.")
+            logging.info(f"Skipped MinIO upload for {machine_name} as firmware update was successful.")
+            await asyncio.to_thread(remove_machine_output, machine_name, base_output_dir_str)
+            return machine_name, True, True, False
+
+        # Upload to MinIO (only if update failed)
+        print_step(f"Uploading logs for {machine_name} to MinIO (update failure detected)...")
+        upload_success = await asyncio.to_thread(upload_to_minio, machine_name, base_output_dir_str)
+
+        if not upload_success:
+            print_warning(f"MinIO upload failed for {machine_name}.")
+            return machine_name, False, False, True
+        print_success(f"MinIO upload successful for {machine_name}.")
+        return machine_name, True, False, True
+
+async def process_machines(machine_names, base_source_dir_str="./machines", base_output_dir_str="./output"):
+    """Run process_machine for every machine, at most MACHINE_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(MACHINE_CONCURRENCY)
+    return await asyncio.gather(
+        *(process_machine(machine_name, semaphore, base_source_dir_str, base_output_dir_str) for machine_name in machine_names),
+        return_exceptions=True
+    )
+
 def main():
     """Main function to run Prep, Extract, and Upload steps."""
     start_time = time.time()
@@ -533,80 +868,36 @@ def main():
             print_error(f"Source directory '{base_source_dir}' not found. Cannot process machines.")
             return False
             
-        machines = [d.name for d in base_source_dir.iterdir() if d.is_dir()]
+        # Sorted once so logging and processing share the same order
+        machines = sorted(d.name for d in base_source_dir.iterdir() if d.is_dir())
         
         if not machines:
             print_warning(f"No machine directories found in {base_source_dir}")
             # Exit cleanly if no machines found
             overall_success = True # No work to do is still a success
         else:
-            print_step(f"Found {len(machines)} machines to process: {   ',  '.join(sorted(machines))}")
+            print_step(f"Found {len(machines)} machines to process: {   ',  '.join(machines)}")
             
             prep_extract_failures = []
-            for machine_name in sorted(machines):
-                machine_path = base_source_dir / machine_name
-                print_section(f"Processing {machine_name} - Prep, Extract & Upload")
-                
-                # Prepare the machine using shared function
-                print_step(f"Preparing {machine_name}...")
-                prep_success = shared_prepare_machine(str(machine_path))
-                
-                if not prep_success:
-                    print_warning(f"Preparation failed for {machine_name}. Skipping extraction.")
-                    prep_extract_failures.append(machine_name)
-                    continue # Skip to next machine
-                else:
-                    print_success(f"Preparation successful for {machine_name}.")
-                    
-                # Run log extraction using shared function
-                print_step(f"Running log extraction for {machine_name}...")
-                extract_success = shared_run_log_extraction(machine_name, str(base_source_dir), str(base_output_dir))
-                
-                if not extract_success:
-                    print_warning(f"Log extraction failed for {machine_name}.")
+            # Machines are independent, so their steps overlap in one asyncio pipeline
+            results = asyncio.run(process_machines(machines, str(base_source_dir), str(base_output_dir)))
+            for machine_name, result in zip(machines, results):
+                if isinstance(result, Exception):
+                    error_msg = f"Processing {machine_name} failed: {str(result)}"
+                    print_error(error_msg)
+                    logging.error(error_msg)
                     prep_extract_failures.append(machine_name)
-                    # Continue to next machine
-                else:
-                    print_success(f"Log extraction successful for {machine_name}.")
-                    
-                    # Check firmware update status
-                    print_step(f"Checking firmware update status for {machine_name}...")
-                    is_update_success = check_firmware_update_status(machine_name, str(base_output_dir))
-                    
-                    # Only proceed with upload if update was a failure
-                    if is_update_success:
-                        success_count += 1  # Increment success counter
-                        print_step(f"Skipping MinIO upload for {machine_name} as firmware update was successful.")
-                        logging.info(f"Skipped MinIO upload for {machine_name} as firmware update was successful.")
-                        
-                        # Remove the machine's output directory to prevent master.py from processing it
-                        try:
-                            machine_output_path = os.path.join(str(base_output_dir), machine_name)
-                            if os.path.exists(machine_output_path):
-                                print_step(f"Removing output directory for {machine_name} to prevent further processing...")
-                                shutil.rmtree(machine_output_path)
-                                print_success(f"Successfully removed output directory for {machine_name}")
-                                logging.info(f"Removed output directory for {machine_name} at {machine_output_path}")
-                            else:
-                                print_warning(f"Output directory for {machine_name} not found at {machine_output_path}")
-                                logging.warning(f"Output directory for {machine_name} not found at {machine_output_path}")
-                        except Exception as e:
-                            error_msg = f"Failed to remove output directory for {machine_name}: {str(e)}"
-                            print_error(error_msg)
-                            logging.error(error_msg)
-                            traceback.print_exc()
-                    else:
-                        # Step 3: Upload to MinIO (only if update failed)
-                        failure_count += 1  # Increment failure counter
-                        print_step(f"Uploading logs for {machine_name} to MinIO (update failure detected)...")
-                        upload_success = upload_to_minio(machine_name, str(base_output_dir))
-                        
-                        if not upload_success:
-                            print_warning(f"MinIO upload failed for {machine_name}.")
-                            prep_extract_failures.append(f"{machine_name} (upload)")
-                            # Continue to next machine
-                        else:
-                            print_success(f"MinIO upload successful for {machine_name}.")
+                    continue
+
+                _, ok, is_update_success, is_update_failure = result
+                if is_update_success:
+                    success_count += 1  # Increment success counter
+                elif is_update_failure:
+                    failure_count += 1  # Increment failure counter
+
+                if not ok:
+                    # A failed update only reaches the upload step, so that's what went wrong
+                    prep_extract_failures.append(f"{machine_name} (upload)" if is_update_failure else machine_name)
 
             if prep_extract_failures:
                 print_warning(f"Preparation or extraction failed for: {', '.join(prep_extract_failures)}")
@@ -0,0 +1,137 @@
+import re
+from enum import Enum
+
+
+def extract_last_update_type(text):
+    """
+    Extract the value of the last "update_type" field in the text.
+    Returns the value (online or offline) or None if not found.
+    """
+    return extract_last_update_type_bytes(text.encode('utf-8'))
+
+def check_firmware_update_status(log_file_path):
+    """Checks online firmware update status based on fwInstallState."""
+    try:
+        with open(log_file_path, 'rb') as file:
+            log_data = file.read()
+    except FileNotFoundError:
+        return f"{log_file_path}: ❌ Error - File not found."
+
+    status, message = check_firmware_update_status_bytes(log_data)
+    return f"{log_file_path}: {message}"
+
+def check_offline_firmware_update(log_file_path):
+    """Checks offline firmware update status using two log markers."""
+    try:
+        with open(log_file_path, 'rb') as file:
+            log_data = file.read()
+
+        status, message = check_offline_firmware_update_bytes(log_data)
+        return f"{log_file_path}: {message}"
+
+    except FileNotFoundError:
+        return f"{log_file_path}: ❌ Error - File not found."
+    except Exception as e:
+        return f"{log_file_path}: ❌ Error - {str(e)}"
+
+def determine_update_type_and_check(installsetlog, cidebug):
+    """
+    Main function to classify and verify firmware update.
+    """
+    try:
+        with open(installsetlog, 'rb') as file:
+            installset_data = file.read()
+        with open(cidebug, 'rb') as file:
+            cidebug_data = file.read()
+
+        status, message = determine_update_type_and_check_bytes(installset_data, cidebug_data)
+        return f"{cidebug}: {message}"
+
+    except FileNotFoundError:
+        return f"{cidebug}: ❌ Error - File not found."
+    except Exception as e:
+        return f"{cidebug}: ❌ Error - {str(e)}"
+
+class UpdateStatus(Enum):
+    """Outcome of a firmware update check."""
+    SUCCESS = "success"
+    FAILURE = "failure"
+    UNKNOWN = "unknown"
+    ERROR = "error"
+
+# Byte-level patterns used by determine_update_type_and_check_bytes
+UPDATE_TYPE_KEY = b'"update_type":'
+FW_STATE_PATTERN = re.compile(rb'Updating iLO with fwInstallState:[^\S\n]*(\w+)', re.IGNORECASE)
+OFFLINE_FETCH_FAILED_PATTERN = re.compile(
+    rb"fetchFailedComponentList Total number of failed components for server name: .*?, bay .*? uuid: .*? 0"
+)
+OFFLINE_ABSAROKA_COMPLETE_PATTERN = re.compile(
+    rb"Absaroka Firmware update is complete for server:"
+)
+
+def extract_last_update_type_bytes(data):
+    """
+    Extract the value of the last "update_type" field in raw log bytes.
+    Returns the decoded value or None if not found.
+    """
+    last_pos = data.rfind(UPDATE_TYPE_KEY)
+    if last_pos == -1:
+        return None
+
+    start_quote_pos = data.find(b'"', last_pos + len(UPDATE_TYPE_KEY))
+    if start_quote_pos == -1:
+        return None  # No opening quote found
+
+    end_quote_pos = data.find(b'"', start_quote_pos + 1)
+    if end_quote_pos == -1:
+        return None  # No closing quote found
+
+    return data[start_quote_pos + 1:end_quote_pos].decode('utf-8', errors='replace')
+
+def check_firmware_update_status_bytes(data):
+    """Checks online firmware update status based on the last fwInstallState in raw log bytes."""
+    final_state = None
+    for match in FW_STATE_PATTERN.finditer(data):
+        final_state = match.group(1)
+
+    if final_state is None:
+        return UpdateStatus.FAILURE, "❌ Failure - Missing 'Updating iLO with fwInstallState:' line."
+    if final_state == b"Activated":
+        return UpdateStatus.SUCCESS, "✅ Success - Firmware update activated."
+    return UpdateStatus.FAILURE, f"❌ Failure - Final fwInstallState was '{final_state.decode('ascii')}'."
+
+def check_offline_firmware_update_bytes(data):
+    """Checks offline firmware update status using two log markers in raw log bytes."""
+    # Separate searches let re scan for each pattern's literal prefix
+    if OFFLINE_FETCH_FAILED_PATTERN.search(data) and OFFLINE_ABSAROKA_COMPLETE_PATTERN.search(data):
+        return UpdateStatus.SUCCESS, "✅ Success - Both offline conditions met."
+    return UpdateStatus.FAILURE, "❌ Failure - Offline conditions not met."
+
+def determine_update_type_and_check_bytes(installset_bytes, cidebug_bytes):
+    """
+    Classify and verify a firmware update from log contents already read as bytes.
+    Returns a (UpdateStatus, message) tuple.
+    """
+    try:
+        update_type = extract_last_update_type_bytes(installset_bytes)
+
+        if update_type == "Online" or update_type == "online":
+            status, message = check_firmware_update_status_bytes(cidebug_bytes)
+        elif update_type == "Offline" or update_type == "offline":
+            status, message = check_offline_firmware_update_bytes(cidebug_bytes)
+        else:
+            return UpdateStatus.UNKNOWN, "⚠️ Could not determine firmware update type."
+
+        return status, f"{message} [{update_type}]"
+
+    except Exception as e:
+        return UpdateStatus.ERROR, f"❌ Error - {str(e)}"
+
+# Example usage
+if __name__ == "__main__":
+    # Test with sample log files
+    
+    installsetlog = "installSetLogs.log"
+    log_file = "ciDebug.log"
+    result = determine_update_type_and_check(installsetlog, log_file)
+    print(result)
\ No newline at end of file